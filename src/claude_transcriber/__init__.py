@@ -6,12 +6,63 @@ Converts JSONL log records into human-readable text matching /export output.
 """
 
 import json
+import mmap
 import re
-from typing import Any
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 __all__ = ["Transcriber", "transcribe_file", "main"]
 
 
+def _loads(data: bytes) -> Any:
+    """Parse one JSON record, preferring orjson when it is installed.
+
+    orjson rejects NaN, Infinity and out-of-range floats that json.loads
+    accepts, so anything orjson refuses is retried with json.loads. That keeps
+    the output independent of which parser is installed.
+
+    Raises ValueError on bad input: json.JSONDecodeError for malformed JSON,
+    or UnicodeDecodeError when the bytes aren't valid UTF-8.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+# Patterns used to clean user text, compiled once at import time.
+_CAVEAT_RE = re.compile(
+    r"^(<local-command-caveat>)?Caveat: The messages below were generated.*?"
+    r"unless the user explicitly asks you to\.(</local-command-caveat>)?\s*",
+    re.DOTALL,
+)
+_STDOUT_RE = re.compile(
+    r"<local-command-stdout>([^<]*)</local-command-stdout>",
+    re.DOTALL,
+)
+_CAVEAT_TAG_RE = re.compile(r"<local-command-caveat>|</local-command-caveat>")
+_COMMAND_NAME_RE = re.compile(r"<command-name>(/[^<]+)</command-name>")
+_COMMAND_ARGS_RE = re.compile(r"<command-args>([^<]*)</command-args>")
+
+# Tools whose args summary is a single input field: name -> (key, truncate at 50)
+_TOOL_ARG_FIELDS: dict[str, tuple[str, bool]] = {
+    "Read": ("file_path", False),
+    "Write": ("file_path", False),
+    "Edit": ("file_path", False),
+    "Glob": ("pattern", False),
+    "Task": ("description", False),
+    "WebSearch": ("query", True),
+    "WebFetch": ("url", True),
+}
+
+
 class Transcriber:
     """Transcribes Claude Code log records to human-readable format."""
 
@@ -143,12 +194,7 @@ class Transcriber:
             return cmd
 
         # Remove caveat boilerplate
-        caveat_pattern = re.compile(
-            r"^(<local-command-caveat>)?Caveat: The messages below were generated.*?"
-            r"unless the user explicitly asks you to\.(</local-command-caveat>)?\s*",
-            re.DOTALL,
-        )
-        text = caveat_pattern.sub("", text)
+        text = _CAVEAT_RE.sub("", text)
 
         # After stripping caveat, check again for command XML
         cmd = self._parse_command_xml(text.strip())
@@ -156,21 +202,16 @@ class Transcriber:
             return cmd
 
         # Clean local-command-stdout tags
-        stdout_pattern = re.compile(
-            r"<local-command-stdout>([^<]*)</local-command-stdout>",
-            re.DOTALL,
-        )
-
         def replace_stdout(m):
             content = m.group(1).strip()
             if not content or content == "(no content)":
                 return ""
             return content
 
-        text = stdout_pattern.sub(replace_stdout, text)
+        text = _STDOUT_RE.sub(replace_stdout, text)
 
         # Clean remaining tags
-        text = re.sub(r"<local-command-caveat>|</local-command-caveat>", "", text)
+        text = _CAVEAT_TAG_RE.sub("", text)
 
         return text.strip()
 
@@ -181,11 +222,11 @@ class Transcriber:
             return None
 
         # Look for command-name tag
-        match = re.search(r"<command-name>(/[^<]+)</command-name>", text)
+        match = _COMMAND_NAME_RE.search(text)
         if match:
             cmd_name = match.group(1)
             # Look for args
-            args_match = re.search(r"<command-args>([^<]*)</command-args>", text)
+            args_match = _COMMAND_ARGS_RE.search(text)
             if args_match and args_match.group(1).strip():
                 return f"{cmd_name} {args_match.group(1).strip()}"
             return cmd_name
@@ -206,6 +247,15 @@ class Transcriber:
 
     def _format_tool_args(self, name: str, input_data: dict[str, Any]) -> str:
         """Format tool input as abbreviated args string."""
+        # Most tools summarize as a single field: one dict lookup
+        field = _TOOL_ARG_FIELDS.get(name)
+        if field is not None:
+            key, truncate = field
+            val = input_data.get(key, "")
+            if truncate and len(val) > 50:
+                return val[:50] + "…"
+            return val
+
         if name == "Bash":
             cmd = input_data.get("command", "")
             if isinstance(cmd, str):
@@ -218,18 +268,6 @@ class Transcriber:
                     return first_line[:57] + "…"
                 return first_line
 
-        elif name == "Read":
-            path = input_data.get("file_path", "")
-            return path
-
-        elif name == "Write":
-            path = input_data.get("file_path", "")
-            return path
-
-        elif name == "Edit":
-            path = input_data.get("file_path", "")
-            return path
-
         elif name == "Grep":
             pattern = input_data.get("pattern", "")
             path = input_data.get("path", "")
@@ -237,22 +275,6 @@ class Transcriber:
                 return f'pattern: "{pattern}", path: "{path}"'
             return f'pattern: "{pattern}"'
 
-        elif name == "Glob":
-            pattern = input_data.get("pattern", "")
-            return pattern
-
-        elif name == "Task":
-            desc = input_data.get("description", "")
-            return desc
-
-        elif name == "WebSearch":
-            query = input_data.get("query", "")
-            return query[:50] + "…" if len(query) > 50 else query
-
-        elif name == "WebFetch":
-            url = input_data.get("url", "")
-            return url[:50] + "…" if len(url) > 50 else url
-
         elif name == "TodoWrite":
             return ""  # No useful summary
 
@@ -317,23 +339,58 @@ class Transcriber:
         return "\n".join(result)
 
 
+def _nonblank(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield each line stripped, skipping blank ones."""
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _split_mmap(mm: mmap.mmap) -> Iterator[bytes]:
+    """Yield the raw newline-separated slices of a memory-mapped file."""
+    start, end = 0, mm.size()
+    while start < end:
+        nl = mm.find(b"\n", start)
+        if nl < 0:
+            nl = end
+        yield mm[start:nl]
+        start = nl + 1
+
+
+def _iter_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield the stripped, non-empty lines of a binary file.
+
+    Regular files are memory-mapped and sliced at newlines, avoiding the
+    file iterator's per-line buffering. Anything that can't be mapped
+    (empty files, pipes) falls back to plain line iteration. Lines are split
+    on b"\n" only; a bare "\r" is not a line break.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        yield from _nonblank(f)
+        return
+
+    with mm:
+        yield from _nonblank(_split_mmap(mm))
+
+
 def transcribe_file(path: str) -> str:
     """Transcribe all records in a JSONL file."""
     transcriber = Transcriber()
     parts = []
 
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+    # Read raw bytes: both parsers accept them, which skips a decode pass.
+    with open(path, "rb") as f:
+        for line in _iter_lines(f):
             try:
-                record = json.loads(line)
-                result = transcriber.transcribe(record)
-                if result:
-                    parts.append(result)
-            except json.JSONDecodeError:
-                pass
+                record = _loads(line)
+            except ValueError:
+                continue
+            result = transcriber.transcribe(record)
+            if result:
+                parts.append(result)
 
     return "\n\n".join(parts)
 
@@ -367,20 +424,17 @@ def main():
     if args.stream or (not args.file and not args.output):
         transcriber = Transcriber()
         first_output = True
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+        for line in _nonblank(sys.stdin.buffer):
             try:
-                record = json.loads(line)
-                out = transcriber.transcribe(record)
-                if out:
-                    if not first_output:
-                        print()  # blank line between outputs
-                    print(out, flush=True)
-                    first_output = False
-            except json.JSONDecodeError:
-                pass
+                record = _loads(line)
+            except ValueError:
+                continue
+            out = transcriber.transcribe(record)
+            if out:
+                if not first_output:
+                    print()  # blank line between outputs
+                print(out, flush=True)
+                first_output = False
         return
 
     # Batch mode: collect all then output
@@ -390,17 +444,14 @@ def main():
         # Read from stdin
         transcriber = Transcriber()
         parts = []
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+        for line in _nonblank(sys.stdin.buffer):
             try:
-                record = json.loads(line)
-                out = transcriber.transcribe(record)
-                if out:
-                    parts.append(out)
-            except json.JSONDecodeError:
-                pass
+                record = _loads(line)
+            except ValueError:
+                continue
+            out = transcriber.transcribe(record)
+            if out:
+                parts.append(out)
         result = "\n\n".join(parts)
 
     if args.output:
@@ -6,7 +6,8 @@ from pathlib import Path
 
 import pytest
 
-from claude_transcriber import Transcriber
+import claude_transcriber
+from claude_transcriber import Transcriber, transcribe_file
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -85,3 +86,93 @@ def test_transcribe_fixture(case_name: str):
             f"User message count mismatch: expected ~{expected_user}, "
             f"got {actual_user}"
         )
+
+
+@pytest.mark.parametrize("stdlib_parser", [False, True])
+@pytest.mark.parametrize("case_name", get_fixture_cases())
+def test_transcribe_file_matches_records(
+    case_name: str, stdlib_parser: bool, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that transcribe_file matches record-by-record transcription."""
+    if stdlib_parser:
+        monkeypatch.setattr(claude_transcriber, "_loads", json.loads)
+    records, _ = load_fixture(case_name)
+
+    transcriber = Transcriber()
+    parts = [r for r in map(transcriber.transcribe, records) if r]
+
+    input_path = FIXTURES_DIR / case_name / "input.jsonl"
+    assert transcribe_file(str(input_path)) == "\n\n".join(parts)
+
+
+def test_user_command_xml_and_caveat():
+    """Test that command XML and caveat boilerplate are cleaned from user text."""
+    transcriber = Transcriber()
+    caveat = (
+        "<local-command-caveat>Caveat: The messages below were generated by the "
+        "user while running local commands. DO NOT respond to these messages "
+        "unless the user explicitly asks you to.</local-command-caveat>"
+    )
+
+    def user(content: str) -> dict:
+        return {"type": "user", "message": {"role": "user", "content": content}}
+
+    command = (
+        "<command-name>/model</command-name>"
+        "<command-message>model</command-message>"
+        "<command-args>opus</command-args>"
+    )
+    assert transcriber.transcribe(user(command)) == "❯ /model opus"
+    assert transcriber.transcribe(user(caveat + command)) == "❯ /model opus"
+    assert transcriber.transcribe(user(caveat)) is None
+
+    stdout = "<local-command-stdout>Set model to opus</local-command-stdout>"
+    assert transcriber.transcribe(user(stdout)) == "❯ Set model to opus"
+
+
+@pytest.mark.parametrize(
+    "tool, expected",
+    [
+        ({"name": "Read", "input": {"file_path": "/a/b.py"}}, "⏺ Read(/a/b.py)"),
+        ({"name": "Glob", "input": {"pattern": "**/*.py"}}, "⏺ Glob(**/*.py)"),
+        ({"name": "WebFetch", "input": {"url": "x" * 60}}, f"⏺ WebFetch({'x' * 50}…)"),
+        ({"name": "Bash", "input": {"command": "ls\npwd"}}, "⏺ Bash(ls…)"),
+        ({"name": "Grep", "input": {"pattern": "foo"}}, '⏺ Grep(pattern: "foo")'),
+        ({"name": "TodoWrite", "input": {"todos": []}}, "⏺ TodoWrite"),
+        ({"name": "Other", "input": {"path": "/tmp"}}, "⏺ Other(/tmp)"),
+    ],
+)
+def test_format_tool_use(tool: dict, expected: str):
+    """Test the abbreviated args summary for tool calls."""
+    assert Transcriber()._format_tool_use(tool) == expected
+
+
+@pytest.mark.parametrize("stdlib_parser", [False, True])
+def test_transcribe_file_edge_cases(
+    tmp_path: Path, stdlib_parser: bool, monkeypatch: pytest.MonkeyPatch
+):
+    """Test transcribe_file on empty files, blank or bad lines and no final newline."""
+    if stdlib_parser:
+        monkeypatch.setattr(claude_transcriber, "_loads", json.loads)
+    empty = tmp_path / "empty.jsonl"
+    empty.write_bytes(b"")
+    assert transcribe_file(str(empty)) == ""
+
+    record = {"type": "user", "message": {"role": "user", "content": "hi"}}
+    log = tmp_path / "log.jsonl"
+    log.write_bytes(
+        b"\n" + json.dumps(record).encode() + b"\r\n\nnot json\n\xe9\n"
+        + json.dumps(record).encode()
+    )
+    assert transcribe_file(str(log)) == "❯ hi\n\n❯ hi"
+
+
+def test_transcribe_file_non_finite_numbers(tmp_path: Path):
+    """Test that records orjson rejects (NaN, Infinity, 1e400) are still transcribed."""
+    log = tmp_path / "log.jsonl"
+    log.write_bytes(
+        b'{"type": "user", "message": {"content": "a"}, "x": NaN}\n'
+        b'{"type": "user", "message": {"content": "b"}, "x": Infinity}\n'
+        b'{"type": "user", "message": {"content": "c"}, "x": 1e400}\n'
+    )
+    assert transcribe_file(str(log)) == "❯ a\n\n❯ b\n\n❯ c"